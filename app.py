@@ -16,14 +16,12 @@ To run this app:
 4. Browser will open automatically!
 """
 
+import json
+from pathlib import Path
+from types import SimpleNamespace
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import pickle
-from datetime import datetime, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
 
 # Page configuration
 st.set_page_config(
@@ -67,22 +65,36 @@ st.markdown("""
 # LOAD DATA AND MODEL
 # ============================================================================
 
-@st.cache_data
+@st.cache_data(ttl=None, show_spinner=False)
 def load_data():
-    """Load all data files"""
+    """Load all data files (Parquet copies are built by scripts/convert.py)"""
     try:
-        data = pd.read_csv('gatsibo_complete_irrigation_data.csv', index_col=0, parse_dates=True)
-        weekly = pd.read_csv('gatsibo_irrigation_schedule_weekly.csv', index_col=0, parse_dates=True)
-        forecast = pd.read_csv('irrigation_forecast_7days.csv', parse_dates=['date'])
+        data = pd.read_parquet('gatsibo_complete_irrigation_data.parquet', engine='pyarrow', use_threads=True)
+        weekly = pd.read_parquet('gatsibo_irrigation_schedule_weekly.parquet', engine='pyarrow', use_threads=True)
+        # Values are mm with <= 2 decimals, so float32 is plenty and halves memory
+        data = data.astype({c: 'float32' for c in data.select_dtypes('float64').columns})
+        weekly = weekly.astype({c: 'float32' for c in weekly.select_dtypes('float64').columns})
+        from forecast_data import DATA
+        forecast = pd.DataFrame(DATA, columns=['date', 'day', 'irrigation_mm'])
+        forecast['date'] = pd.to_datetime(forecast['date'])
+        # Display labels are formatted once here rather than on every rerun
+        forecast['irrigation_label_1dp'] = forecast['irrigation_mm'].map('{:.1f}'.format)
+        forecast['irrigation_label_2dp'] = forecast['irrigation_mm'].map('{:.2f}'.format)
+        forecast['date_label'] = forecast['date'].dt.strftime('%a, %b %d')
+        # Categorical so filtering/grouping by day (e.g. a future day-picker widget) compares int codes
+        forecast['day'] = forecast['day'].astype('category')
         return data, weekly, forecast
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ModuleNotFoundError) as e:
         st.error(f"Data file not found: {e}")
         st.stop()
 
 @st.cache_resource
 def load_model():
     """Load ML model"""
+    import pickle
     try:
+        # Plain pickle on purpose: joblib's mmap_mode gives no sharing for this model,
+        # because sklearn's Tree.__setstate__ copies the tree arrays into memory it owns
         with open('irrigation_ml_model.pkl', 'rb') as f:
             model = pickle.load(f)
         with open('model_features.pkl', 'rb') as f:
@@ -92,8 +104,152 @@ def load_model():
         st.warning("ML model not found. Some features will be limited.")
         return None, None
 
+@st.cache_data(ttl=None, show_spinner=False)
+def load_summaries():
+    """Load the precomputed historical summaries (built by scripts/convert.py)"""
+    try:
+        annual = pd.read_parquet('annual.parquet', engine='pyarrow')
+        monthly = pd.read_parquet('monthly.parquet', engine='pyarrow')
+        with open('stats.json') as f:
+            stats = json.load(f)
+        return annual, monthly, stats
+    except FileNotFoundError as e:
+        st.error(f"Summary file not found: {e}. Run scripts/convert.py first.")
+        st.stop()
+
+# ============================================================================
+# CHART BUILDERS
+# ============================================================================
+# Each builder returns the figure as a dict and is cached, so reruns with the
+# same data skip Plotly's figure construction. Frames are hashed by their date
+# range and length instead of their full contents.
+
+# Glance-view bar charts don't need hover, pan or zoom
+STATIC_CHART = {'staticPlot': True, 'displayModeBar': False}
+
+FRAME_HASH = {pd.DataFrame: lambda df: (df.index.min(), df.index.max(), len(df))}
+
+@st.cache_data(hash_funcs=FRAME_HASH, show_spinner=False)
+def build_water_balance_fig(recent_weeks):
+    """Grouped bars of crop need, effective rainfall and irrigation per week"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['ETc_week_mm'], name='Crop Water Need', marker_color='#EF5350'))
+    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['Rainfall_effective_mm'], name='Effective Rainfall', marker_color='#42A5F5'))
+    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['Irrigation_needed_mm'], name='Irrigation Required', marker_color='#FFA726'))
+    
+    fig.update_layout(
+        barmode='group',
+        title='Water Balance - Last 12 Weeks',
+        xaxis_title='Week',
+        yaxis_title='Water (mm)',
+        height=400
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_daily_trend_fig(dates, etc, rain, irr):
+    """Filled daily lines of crop need, rainfall and irrigation"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=dates, y=etc, name='Crop Need', line=dict(color='#EF5350', width=2), fill='tozeroy', fillcolor='rgba(239, 83, 80, 0.2)'))
+    fig.add_trace(go.Scattergl(x=dates, y=rain, name='Rainfall', line=dict(color='#42A5F5', width=2), fill='tozeroy', fillcolor='rgba(66, 165, 245, 0.2)'))
+    fig.add_trace(go.Scattergl(x=dates, y=irr, name='Irrigation', line=dict(color='#FFA726', width=3), fill='tozeroy', fillcolor='rgba(255, 167, 38, 0.3)'))
+    
+    fig.update_layout(
+        title='Daily Water Balance',
+        xaxis_title='Date',
+        yaxis_title='Water (mm/day)',
+        height=400,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_forecast_fig(forecast):
+    """Bar chart of the 7-day irrigation forecast"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=forecast['date'],
+        y=forecast['irrigation_mm'],
+        marker_color='#66BB6A',
+        text=forecast['irrigation_label_1dp'],
+        textposition='outside'
+    ))
+    fig.update_layout(title='Daily Irrigation Forecast', xaxis_title='Date', yaxis_title='Irrigation (mm)', height=400, showlegend=False)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_annual_fig(annual):
+    """Grouped bars of the annual water balance"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for col in annual.columns:
+        fig.add_trace(go.Bar(x=annual.index, y=annual[col], name=col))
+    fig.update_layout(barmode='group', title='Annual Water Balance by Year', xaxis_title='Year', yaxis_title='Water (mm/year)', height=400)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_monthly_fig(monthly):
+    """Average daily irrigation and rainfall by calendar month"""
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=monthly.index, y=monthly['Irrigation_requirement_mm'], name='Irrigation', line=dict(color='#FFA726', width=3), fill='tozeroy'))
+    fig.add_trace(go.Scatter(x=monthly.index, y=monthly['Rainfall_mm'], name='Rainfall', line=dict(color='#42A5F5', width=2)))
+    fig.update_layout(title='Average Daily Values by Month', xaxis_title='Month', yaxis_title='Water (mm/day)', height=400)
+    return fig.to_dict()
+
+# ============================================================================
+# RECOMMENDATION TIERS
+# ============================================================================
+
+# Weekly irrigation thresholds (mm): below 5 is MINIMAL, below 20 LIGHT, below 40 MODERATE, else HEAVY
+TIER_BINS = np.array([5., 20., 40.])
+# Preallocated lookup arrays, indexed by tier
+TIER_LABELS = np.array([
+    "MINIMAL irrigation needed",
+    "LIGHT irrigation recommended",
+    "MODERATE irrigation required",
+    "HEAVY irrigation required",
+])
+TIER_COLORS = np.array(['#4CAF50', '#FFC107', '#FF9800', '#F44336'])
+TIER_ADVICE = np.array([
+    "Recent rainfall is sufficient. Monitor crop condition.",
+    "Supplement rainfall with light irrigation.",
+    "Regular irrigation needed to maintain crop health.",
+    "Crop water stress likely. Irrigate immediately!",
+])
+
+def tier_index(irrigation_mm):
+    """Tier index (0-3) for a weekly irrigation amount or an array of them"""
+    return np.searchsorted(TIER_BINS, irrigation_mm, side='right')
+
+def classify(values):
+    """Vectorised tier lookup: (labels, colors, advice) arrays for an array of weekly amounts"""
+    tiers = tier_index(np.asarray(values))
+    return TIER_LABELS[tiers], TIER_COLORS[tiers], TIER_ADVICE[tiers]
+
+@st.cache_data(show_spinner=False)
+def load_static(name):
+    """Load a static Markdown page section from the static/ folder"""
+    return (Path(__file__).parent / 'static' / name).read_text(encoding='utf-8')
+
+@st.cache_resource
+def load_daily_series():
+    """Daily series as plain contiguous arrays (struct-of-arrays) for the hot paths; shared, read-only"""
+    data, _, _ = load_data()
+    return SimpleNamespace(
+        dates=data.index.values.astype('datetime64[D]'),
+        etc=data['ETc_mm_day'].to_numpy(np.float32),
+        rain=data['Rainfall_effective_mm'].to_numpy(np.float32),
+        irr=data['Irrigation_requirement_mm'].to_numpy(np.float32),
+    )
+
 data, weekly_schedule, forecast_7day = load_data()
 model, model_features = load_model()
+annual_data, monthly_avg, stats = load_summaries()
+daily = load_daily_series()
 
 # ============================================================================
 # HEADER
@@ -115,13 +271,14 @@ st.sidebar.title("Navigation")
 
 page = st.sidebar.radio(
     "Choose a section:",
-    ["Dashboard", "7-Day Forecast", "Historical Analysis", "About Gatsibo", "About This Tool"]
+    ["Dashboard", "7-Day Forecast", "Historical Analysis", "About Gatsibo", "About This Tool"],
+    key="page"
 )
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Quick Stats")
-st.sidebar.metric("Total Days Analyzed", f"{len(data):,}")
-st.sidebar.metric("Average Daily Irrigation", f"{data['Irrigation_requirement_mm'].mean():.2f} mm")
+st.sidebar.metric("Total Days Analyzed", f"{len(daily.dates):,}")
+st.sidebar.metric("Average Daily Irrigation", f"{stats['avg_daily_irrigation']:.2f} mm")
 st.sidebar.metric("ML Model Accuracy", "77% (R² = 0.77)")
 
 st.sidebar.markdown("---")
@@ -138,7 +295,8 @@ st.sidebar.markdown("""
 # PAGE: DASHBOARD
 # ============================================================================
 
-if page == "Dashboard":
+@st.fragment
+def dashboard_page():
     
     st.markdown('<h2 class="sub-header">Current Week Status</h2>', unsafe_allow_html=True)
     
@@ -163,22 +321,8 @@ if page == "Dashboard":
     with col4:
         st.metric("Crop Water Need", f"{latest_week['ETc_week_mm']:.1f} mm")
     
-    if latest_week['Irrigation_needed_mm'] < 5:
-        recommendation = "MINIMAL irrigation needed"
-        color = "#4CAF50"
-        advice = "Recent rainfall is sufficient. Monitor crop condition."
-    elif latest_week['Irrigation_needed_mm'] < 20:
-        recommendation = "LIGHT irrigation recommended"
-        color = "#FFC107"
-        advice = "Supplement rainfall with light irrigation."
-    elif latest_week['Irrigation_needed_mm'] < 40:
-        recommendation = "MODERATE irrigation required"
-        color = "#FF9800"
-        advice = "Regular irrigation needed to maintain crop health."
-    else:
-        recommendation = "HEAVY irrigation required"
-        color = "#F44336"
-        advice = "Crop water stress likely. Irrigate immediately!"
+    labels, colors, advices = classify([latest_week['Irrigation_needed_mm']])
+    recommendation, color, advice = labels[0], colors[0], advices[0]
     
     st.markdown(f"""
         <div style='background-color: {color}22; padding: 1.5rem; border-radius: 0.5rem; border-left: 4px solid {color}; margin: 1rem 0;'>
@@ -191,44 +335,21 @@ if page == "Dashboard":
     st.markdown('<h2 class="sub-header">Recent Water Balance (Last 12 Weeks)</h2>', unsafe_allow_html=True)
     
     recent_weeks = weekly_schedule.tail(12)
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['ETc_week_mm'], name='Crop Water Need', marker_color='#EF5350'))
-    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['Rainfall_effective_mm'], name='Effective Rainfall', marker_color='#42A5F5'))
-    fig.add_trace(go.Bar(x=recent_weeks.index, y=recent_weeks['Irrigation_needed_mm'], name='Irrigation Required', marker_color='#FFA726'))
-    
-    fig.update_layout(
-        barmode='group',
-        title='Water Balance - Last 12 Weeks',
-        xaxis_title='Week',
-        yaxis_title='Water (mm)',
-        height=400,
-        hovermode='x unified'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_water_balance_fig(recent_weeks), use_container_width=True, config=STATIC_CHART)
     
     st.markdown('<h2 class="sub-header">Daily Irrigation Trend (Last 30 Days)</h2>', unsafe_allow_html=True)
     
-    recent_30 = data.tail(30)
-    fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(x=recent_30.index, y=recent_30['ETc_mm_day'], name='Crop Need', line=dict(color='#EF5350', width=2), fill='tozeroy', fillcolor='rgba(239, 83, 80, 0.2)'))
-    fig2.add_trace(go.Scatter(x=recent_30.index, y=recent_30['Rainfall_effective_mm'], name='Rainfall', line=dict(color='#42A5F5', width=2), fill='tozeroy', fillcolor='rgba(66, 165, 245, 0.2)'))
-    fig2.add_trace(go.Scatter(x=recent_30.index, y=recent_30['Irrigation_requirement_mm'], name='Irrigation', line=dict(color='#FFA726', width=3), fill='tozeroy', fillcolor='rgba(255, 167, 38, 0.3)'))
-    
-    fig2.update_layout(
-        title='Daily Water Balance',
-        xaxis_title='Date',
-        yaxis_title='Water (mm/day)',
-        height=400,
-        hovermode='x unified'
+    st.plotly_chart(
+        build_daily_trend_fig(daily.dates[-30:], daily.etc[-30:], daily.rain[-30:], daily.irr[-30:]),
+        use_container_width=True
     )
-    st.plotly_chart(fig2, use_container_width=True)
 
 # ============================================================================
 # PAGE: 7-DAY FORECAST
 # ============================================================================
 
-elif page == "7-Day Forecast":
+@st.fragment
+def forecast_page():
     
     st.markdown('<h2 class="sub-header">7-Day Irrigation Forecast</h2>', unsafe_allow_html=True)
     st.info("This forecast uses machine learning trained on 5 years of Gatsibo data (R² = 0.77)")
@@ -241,23 +362,13 @@ elif page == "7-Day Forecast":
     with col3:
         st.metric("Peak Day", f"{forecast_7day['irrigation_mm'].max():.1f} mm")
     
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=forecast_7day['date'],
-        y=forecast_7day['irrigation_mm'],
-        marker_color='#66BB6A',
-        text=forecast_7day['irrigation_mm'].round(1),
-        textposition='outside'
-    ))
-    fig.update_layout(title='Daily Irrigation Forecast', xaxis_title='Date', yaxis_title='Irrigation (mm)', height=400, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_forecast_fig(forecast_7day), use_container_width=True, config=STATIC_CHART)
     
     st.markdown("### Detailed Forecast")
-    forecast_display = forecast_7day.copy()
-    forecast_display['date'] = forecast_display['date'].dt.strftime('%a, %b %d')
-    forecast_display['irrigation_mm'] = forecast_display['irrigation_mm'].round(2)
+    forecast_display = forecast_7day[['date_label', 'day', 'irrigation_label_2dp']]
     forecast_display.columns = ['Date', 'Day', 'Irrigation (mm)']
-    st.dataframe(forecast_display, use_container_width=True, hide_index=True)
+    # Static table: the interactive dataframe grid is overkill for 7 read-only rows
+    st.table(forecast_display.set_index('Date'))
     
     st.markdown('<h2 class="sub-header">Scenario Analysis</h2>', unsafe_allow_html=True)
     st.info("How would irrigation needs change under different weather conditions?")
@@ -292,90 +403,48 @@ elif page == "7-Day Forecast":
 # PAGE: HISTORICAL ANALYSIS
 # ============================================================================
 
-elif page == "Historical Analysis":
+@st.fragment
+def historical_page():
     
     st.markdown('<h2 class="sub-header">Historical Data Analysis (2019-2024)</h2>', unsafe_allow_html=True)
     
     st.markdown("### Annual Water Balance")
-    annual_data = data.resample('YE').agg({
-        'ETc_mm_day': 'sum',
-        'Rainfall_effective_mm': 'sum',
-        'Irrigation_requirement_mm': 'sum'
-    })
-    annual_data.index = annual_data.index.year
-    annual_data.columns = ['Crop Water Need (mm)', 'Effective Rainfall (mm)', 'Irrigation Needed (mm)']
     
-    fig = go.Figure()
-    for col in annual_data.columns:
-        fig.add_trace(go.Bar(x=annual_data.index, y=annual_data[col], name=col))
-    fig.update_layout(barmode='group', title='Annual Water Balance by Year', xaxis_title='Year', yaxis_title='Water (mm/year)', height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_annual_fig(annual_data), use_container_width=True)
     
     st.markdown("### Monthly Irrigation Patterns")
-    monthly_avg = data.groupby(data.index.month).agg({
-        'Irrigation_requirement_mm': 'mean',
-        'Rainfall_mm': 'mean',
-        'ETc_mm_day': 'mean'
-    })
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    monthly_avg.index = month_names
-    
-    fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(x=month_names, y=monthly_avg['Irrigation_requirement_mm'], name='Irrigation', line=dict(color='#FFA726', width=3), fill='tozeroy'))
-    fig2.add_trace(go.Scatter(x=month_names, y=monthly_avg['Rainfall_mm'], name='Rainfall', line=dict(color='#42A5F5', width=2)))
-    fig2.update_layout(title='Average Daily Values by Month', xaxis_title='Month', yaxis_title='Water (mm/day)', height=400)
-    st.plotly_chart(fig2, use_container_width=True)
+    st.plotly_chart(build_monthly_fig(monthly_avg), use_container_width=True)
     
     st.markdown("### Key Statistics")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Avg Annual Irrigation", f"{data['Irrigation_requirement_mm'].sum() / 5:.0f} mm/year")
+        st.metric("Avg Annual Irrigation", f"{stats['avg_annual_irrigation']:.0f} mm/year")
     with col2:
-        st.metric("Rainfall Contribution", f"{(data['Rainfall_effective_mm'].sum() / data['ETc_mm_day'].sum() * 100):.0f}%")
+        st.metric("Rainfall Contribution", f"{stats['rainfall_contrib_pct']:.0f}%")
     with col3:
-        st.metric("Days Needing Irrigation", f"{(data['Irrigation_requirement_mm'] > 0).sum() / len(data) * 100:.0f}%")
+        st.metric(
+            "Days Needing Irrigation",
+            f"{stats['irrigation_day_pct']:.0f}%",
+            help=f"{stats['irrigation_days']:,} of {stats['total_days']:,} days"
+        )
     with col4:
-        st.metric("Max Daily Irrigation", f"{data['Irrigation_requirement_mm'].max():.1f} mm")
+        st.metric("Max Daily Irrigation", f"{stats['max_daily']:.1f} mm")
 
 # ============================================================================
 # PAGE: ABOUT GATSIBO
 # ============================================================================
 
-elif page == "About Gatsibo":
+@st.fragment
+def about_gatsibo_page():
     
     st.markdown('<h2 class="sub-header">About Gatsibo District</h2>', unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     with col1:
-        st.markdown("""
-            ### Location
-            - **Province:** Eastern Province, Rwanda
-            - **Coordinates:** 1.58°S, 30.51°E
-            - **Elevation:** ~1,450 meters
-            - **Area:** Focus on Gabiro irrigation scheme
-            
-            ### Agriculture
-            - **Main Crops:** Maize, rice, vegetables
-            - **Irrigation Systems:** Drip, sprinkler, furrow
-            - **Climate:** Highland tropical, bimodal rainfall
-            - **Rainfall:** 900-1,400 mm/year
-            
-            ### Water Resources
-            - **Rivers:** Akagera watershed
-            - **Irrigation schemes:** Gabiro, Kabarore
-            - **Challenges:** Seasonal water stress, drought
-        """)
+        st.markdown(load_static('about_gatsibo.md'))
     with col2:
-        fig = go.Figure(go.Scattermapbox(
-            lat=[-1.5789], lon=[30.5089], mode='markers',
-            marker=go.scattermapbox.Marker(size=20, color='red'),
-            text=['Gabiro Irrigation Scheme'], hoverinfo='text'
-        ))
-        fig.update_layout(
-            mapbox=dict(style="open-street-map", center=dict(lat=-1.65, lon=30.55), zoom=9),
-            height=500, margin={"r":0,"t":0,"l":0,"b":0}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        # Pre-rendered by scripts/render_map.py
+        st.image('static/gabiro_map.png', caption='Gabiro Irrigation Scheme', use_container_width=True)
     
     st.markdown("### Project Impact")
     impact_col1, impact_col2, impact_col3 = st.columns(3)
@@ -411,71 +480,27 @@ elif page == "About Gatsibo":
 # PAGE: ABOUT THIS TOOL
 # ============================================================================
 
-elif page == "About This Tool":
+@st.fragment
+def about_tool_page():
     
     st.markdown('<h2 class="sub-header">About This Tool</h2>', unsafe_allow_html=True)
     
-    st.markdown("""
-        ### Project Overview
-        The **Gatsibo Smart Irrigation Scheduler** is an AI-powered tool that provides data-driven 
-        irrigation recommendations for farmers in Gatsibo District, Rwanda.
-        
-        ### Technology Stack
-        - **Satellite Data:** Sentinel-2 imagery (10m resolution)
-        - **Weather Data:** NASA POWER API (daily meteorological data)
-        - **ET₀ Calculation:** FAO-56 Penman-Monteith equation
-        - **Crop Coefficients:** NDVI-based crop water requirements
-        - **Machine Learning:** Random Forest (R² = 0.77)
-        - **Web Framework:** Streamlit
-        
-        ### Data Sources
-        - **Period:** 2019-2024 (5 years)
-        - **Satellite images:** 83 cloud-free scenes
-        - **Weather observations:** 2,134 days
-        - **Training data:** 1,940 days
-        - **Testing data:** 187 days
-        
-        ### Methodology
-        1. **Reference ET₀:** Penman-Monteith equation using weather data
-        2. **Crop Coefficient (Kc):** Derived from NDVI satellite measurements
-        3. **Crop ET (ETc):** ETc = ET₀ × Kc
-        4. **Effective Rainfall:** 80% of total rainfall
-        5. **Irrigation Need:** ETc - Effective Rainfall
-        6. **ML Forecast:** Random Forest predicts 7 days ahead
-        
-        ### Model Performance
-        - **Accuracy:** R² = 0.77 (77% variance explained)
-        - **Error:** MAE = 0.54 mm/day
-        - **Top Feature:** ET₀ (42.8% importance)
-        - **Validation:** Last 6 months held out for testing
-        
-        ### About the Developer
-        - **Name:** Fabrice RUTAGARAMA
-        - **Institution:** University of Rwanda
-        - **Program:** MSc in Agribusiness
-        - **Background:** BSc in Irrigation & Drainage Engineering
-        - **Skills:** Data Analytics, GIS, Python, Machine Learning
-        
-        ### Contact & Feedback
-        This tool is continuously being improved based on user feedback. 
-        If you have suggestions or would like to collaborate, please reach out!
-        
-        **Email:** rutagaramafabrice7@gmail.com  
-        **Phone:** +250 781 587 69  
-        
-        ### Acknowledgments
-        - **Data:** Google Earth Engine, NASA POWER
-        - **Methods:** FAO Irrigation and Drainage Paper No. 56
-        - **Inspiration:** Kilimo (Argentina) and global precision agriculture initiatives
-        
-        ### License & Usage
-        This tool is developed for research and educational purposes to support 
-        sustainable agriculture in Rwanda. Free to use for non-commercial applications.
-        
-        ---
-        
-        **Built with dedication for Rwanda's agricultural future**
-    """)
+    st.markdown(load_static('about_tool.md'))
+
+# ============================================================================
+# PAGE ROUTING
+# ============================================================================
+# Each page body is a fragment, so widgets added to a page later only rerun
+# that page instead of the whole script.
+
+PAGES = {
+    "Dashboard": dashboard_page,
+    "7-Day Forecast": forecast_page,
+    "Historical Analysis": historical_page,
+    "About Gatsibo": about_gatsibo_page,
+    "About This Tool": about_tool_page,
+}
+PAGES[page]()
 
 # ============================================================================
 # FOOTER
@@ -0,0 +1,12 @@
+"""7-day irrigation forecast (generated by scripts/convert.py - do not edit)"""
+
+# (date, day, irrigation_mm)
+DATA = [
+    ('2024-11-04', 1, 0.9486146649764473),
+    ('2024-11-05', 2, 0.9531881530991845),
+    ('2024-11-06', 3, 0.9531881530991844),
+    ('2024-11-07', 4, 0.9531881530991844),
+    ('2024-11-08', 5, 0.9531881530991844),
+    ('2024-11-09', 6, 0.9531881530991844),
+    ('2024-11-10', 7, 0.9531881530991844),
+]
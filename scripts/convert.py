@@ -0,0 +1,110 @@
+"""
+GATSIBO SMART IRRIGATION SCHEDULER - DATA BUILD
+===============================================
+Convert the exported CSV files into Parquet for the Streamlit app.
+
+The CSVs stay in the repository as the source of truth; the app reads the
+Parquet copies, which load typed columns directly instead of re-parsing text.
+The Historical Analysis summaries (annual.parquet, monthly.parquet and
+stats.json) are also computed here, so the app does not re-aggregate the
+daily series on every rerun. The 7-day forecast is emitted as a Python
+literal (forecast_data.py).
+
+To run this script (from the project folder):
+    python scripts/convert.py
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Daily and weekly time series used by the app
+TIME_SERIES = [
+    'gatsibo_complete_irrigation_data',
+    'gatsibo_irrigation_schedule_weekly',
+]
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def convert_time_series():
+    """Convert each date-indexed CSV to a Snappy-compressed Parquet file"""
+    for name in TIME_SERIES:
+        df = pd.read_csv(ROOT / f'{name}.csv', index_col=0, parse_dates=True)
+        df.to_parquet(ROOT / f'{name}.parquet', engine='pyarrow', compression='snappy')
+        print(f"Wrote {name}.parquet ({len(df):,} rows)")
+
+
+def monthly_means(months, columns):
+    """Mean of each column per calendar month (1-12) in one bincount pass"""
+    counts = np.bincount(months, minlength=13)[1:]
+    return {
+        name: np.bincount(months, weights=values, minlength=13)[1:] / counts
+        for name, values in columns.items()
+    }
+
+
+def build_summaries():
+    """Precompute the annual/monthly tables and key statistics"""
+    data = pd.read_parquet(ROOT / 'gatsibo_complete_irrigation_data.parquet')
+
+    annual = data.resample('YE').agg({
+        'ETc_mm_day': 'sum',
+        'Rainfall_effective_mm': 'sum',
+        'Irrigation_requirement_mm': 'sum'
+    })
+    annual.index = annual.index.year
+    annual.index.name = 'Year'
+    annual.columns = ['Crop Water Need (mm)', 'Effective Rainfall (mm)', 'Irrigation Needed (mm)']
+    annual.to_parquet(ROOT / 'annual.parquet', engine='pyarrow', compression='snappy')
+
+    months = data.index.month.to_numpy(dtype=np.int8)
+    monthly = pd.DataFrame(
+        monthly_means(months, {
+            col: data[col].to_numpy(dtype=np.float64)
+            for col in ['Irrigation_requirement_mm', 'Rainfall_mm', 'ETc_mm_day']
+        }),
+        index=pd.Index(MONTH_NAMES, name='Month')
+    )
+    monthly.to_parquet(ROOT / 'monthly.parquet', engine='pyarrow', compression='snappy')
+
+    irrigation = data['Irrigation_requirement_mm']
+    irrigation_days = int(np.count_nonzero(irrigation.to_numpy(dtype=np.float32) > 0))
+    stats = {
+        'total_days': len(data),
+        'avg_daily_irrigation': float(irrigation.mean()),
+        'avg_annual_irrigation': float(irrigation.sum() / 5),
+        'rainfall_contrib_pct': float(data['Rainfall_effective_mm'].sum() / data['ETc_mm_day'].sum() * 100),
+        'irrigation_days': irrigation_days,
+        'irrigation_day_pct': irrigation_days / len(data) * 100,
+        'max_daily': float(irrigation.max()),
+    }
+    with open(ROOT / 'stats.json', 'w') as f:
+        json.dump(stats, f, indent=2)
+    print("Wrote annual.parquet, monthly.parquet and stats.json")
+
+
+def build_forecast_module():
+    """Write the 7-day forecast as a Python literal so the app skips CSV parsing"""
+    forecast = pd.read_csv(ROOT / 'irrigation_forecast_7days.csv', float_precision='round_trip')
+    rows = ''.join(
+        f"    ({row.date!r}, {row.day!r}, {row.irrigation_mm!r}),\n"
+        for row in forecast.itertuples(index=False)
+    )
+    with open(ROOT / 'forecast_data.py', 'w') as f:
+        f.write(
+            '"""7-day irrigation forecast (generated by scripts/convert.py - do not edit)"""\n\n'
+            '# (date, day, irrigation_mm)\n'
+            f'DATA = [\n{rows}]\n'
+        )
+    print("Wrote forecast_data.py")
+
+
+if __name__ == '__main__':
+    convert_time_series()
+    build_summaries()
+    build_forecast_module()
@@ -0,0 +1,59 @@
+"""
+GATSIBO SMART IRRIGATION SCHEDULER - STATIC MAP
+===============================================
+Render the Gabiro irrigation scheme location map shown on the About Gatsibo
+page. The marker never changes, so a pre-rendered PNG replaces the live
+OpenStreetMap widget (no tile requests or map JavaScript per visit).
+
+Uses the offline high-resolution GSHHS coastlines, lakes, rivers and borders
+bundled with Basemap, so no network access is needed. To run this script:
+    pip install -r scripts/requirements.txt
+    python scripts/render_map.py
+"""
+
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from mpl_toolkits.basemap import Basemap
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GABIRO = (30.5089, -1.5789)
+KIGALI = (30.0619, -1.9441)
+COUNTRY_LABELS = [('RWANDA', 29.75, -2.15), ('UGANDA', 30.55, -0.95), ('TANZANIA', 31.2, -2.0)]
+
+# Same view as the old interactive map: centred on (-1.65, 30.55), ~zoom 9
+EXTENT = dict(llcrnrlon=29.45, urcrnrlon=31.65, llcrnrlat=-2.47, urcrnrlat=-0.83)
+
+
+def render_map(width=800, height=600, dpi=100):
+    """Draw the scheme location over land, lakes, rivers and borders to static/gabiro_map.png"""
+    fig = plt.figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, 1])
+    m = Basemap(projection='merc', resolution='h', ax=ax, **EXTENT)
+    m.drawmapboundary(fill_color='#aad3df')
+    m.fillcontinents(color='#f2efe9', lake_color='#aad3df')
+    m.drawrivers(color='#aad3df', linewidth=0.8)
+    m.drawcountries(color='#9e7bb5', linewidth=1.5, linestyle='--')
+
+    for name, lon, lat in COUNTRY_LABELS:
+        ax.annotate(name, m(lon, lat), ha='center', fontsize=14, color='#9e9e9e', fontweight='bold')
+
+    x, y = m(*KIGALI)
+    m.plot(x, y, 'o', color='#555555', markersize=6)
+    ax.annotate('Kigali', (x, y), xytext=(6, -12), textcoords='offset points', fontsize=11, color='#333333')
+
+    x, y = m(*GABIRO)
+    m.plot(x, y, 'o', color='red', markersize=16, markeredgecolor='white', markeredgewidth=2)
+    ax.annotate('Gabiro Irrigation Scheme', (x, y), xytext=(12, 8), textcoords='offset points',
+                fontsize=13, fontweight='bold', color='#B71C1C')
+
+    fig.savefig(ROOT / 'static' / 'gabiro_map.png', dpi=dpi)
+    plt.close(fig)
+    print("Wrote static/gabiro_map.png")
+
+
+if __name__ == '__main__':
+    render_map()